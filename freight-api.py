@@ -25,7 +25,7 @@ from pathlib import Path
 from typing import Optional
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 # Add the freight package to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -58,11 +58,11 @@ async def get_overview(migration_root: Optional[str] = None):
         # Ensure global config exists
         orchestrator.ensure_global_config(str(orchestrator.migration_root))
         
-        # Scan directories and get overview data
+        # Scan directories and get overview data, serialized in one pass
         orchestrator.scan_directories()
-        overview_data = orchestrator.get_overview_data()
+        overview_json = orchestrator.get_overview_json()
         
-        return JSONResponse(content=overview_data)
+        return Response(content=overview_json, media_type="application/json")
         
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
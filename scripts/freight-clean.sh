@@ -7,7 +7,7 @@ set -euo pipefail
 # Configuration
 SCRIPT_NAME="freight-clean"
 VERSION="1.0.0"
-SCRIPT_DIR="$(dirname "$(realpath "$0")")"
+SCRIPT_DIR="$(dirname "$("${FREIGHT_REALPATH:-realpath}" "$0")")"
 
 # Source shared libraries
 source "$SCRIPT_DIR/utils/logging.sh"
@@ -45,7 +45,7 @@ get_clean_directories() {
     fi
     
     local dir_names
-    if ! dir_names=$(jq -r '.clean.target_directories[]?' "$config_file" 2>/dev/null); then
+    if ! dir_names=$("${FREIGHT_JQ:-jq}" -r '.clean.target_directories[]?' "$config_file" 2>/dev/null); then
         log_error "Failed to read directory names from global config file"
         log_info "Please ensure global config.json has a valid clean.target_directories array"
         return 1
@@ -96,13 +96,13 @@ clean_directory() {
             if command -v gdu >/dev/null 2>&1; then
                 # GNU du available
                 item_size=$(gdu -sb "$target_path" 2>/dev/null | cut -f1 || echo "0")
-            elif du -sb "$target_path" >/dev/null 2>&1; then
+            elif "${FREIGHT_DU:-du}" -sb "$target_path" >/dev/null 2>&1; then
                 # Linux du with -b flag
-                item_size=$(du -sb "$target_path" 2>/dev/null | cut -f1 || echo "0")
+                item_size=$("${FREIGHT_DU:-du}" -sb "$target_path" 2>/dev/null | cut -f1 || echo "0")
             else
                 # macOS du, use -k and convert to bytes
                 local size_kb
-                size_kb=$(du -sk "$target_path" 2>/dev/null | cut -f1 || echo "0")
+                size_kb=$("${FREIGHT_DU:-du}" -sk "$target_path" 2>/dev/null | cut -f1 || echo "0")
                 item_size=$((size_kb * 1024))
             fi
             
@@ -161,7 +161,7 @@ main() {
     [ -d "$migration_root" ] || { log_error "Directory not found: $migration_root"; exit 1; }
     [ -w "$migration_root" ] || { log_error "Directory not writable: $migration_root"; exit 1; }
     
-    migration_root=$(realpath "$migration_root")
+    migration_root=$("${FREIGHT_REALPATH:-realpath}" "$migration_root")
     
     log_info "Starting clean of: $migration_root"
     if [ "$dry_run" = "true" ]; then
@@ -184,7 +184,7 @@ main() {
     local subdirs=()
     while IFS= read -r -d '' dir; do
         subdirs+=("$dir")
-    done < <(find "$migration_root" -mindepth 1 -maxdepth 1 -type d -print0)
+    done < <("${FREIGHT_FIND:-find}" "$migration_root" -mindepth 1 -maxdepth 1 -type d -print0)
     
     [ ${#subdirs[@]} -gt 0 ] || { log_warning "No subdirectories found"; exit 0; }
     
@@ -7,7 +7,7 @@ set -euo pipefail
 # Configuration
 SCRIPT_NAME="freight-scan"
 VERSION="1.0.0"
-SCRIPT_DIR="$(dirname "$(realpath "$0")")"
+SCRIPT_DIR="$(dirname "$("${FREIGHT_REALPATH:-realpath}" "$0")")"
 
 # Source shared libraries
 source "$SCRIPT_DIR/utils/logging.sh"
@@ -16,10 +16,14 @@ source "$SCRIPT_DIR/utils/json-utils.sh"
 usage() {
     cat << EOF
 Usage: $SCRIPT_NAME <target_directory>
+       $SCRIPT_NAME --stdin-batch
 
 Scans a directory and creates scan.json in target_directory/.freight/scan.json.
 Assumes Linux environment.
 
+With --stdin-batch, reads target directories from stdin (one per line) and
+prints "OK <dir>" or "FAIL <dir> <message>" on stdout as each one finishes.
+
 Examples:
     $SCRIPT_NAME /path/to/scan  # Scans specified directory
 EOF
@@ -34,14 +38,14 @@ scan_directory() {
     
     # Get directory mtime (Linux only)
     local dir_mtime
-    dir_mtime=$(stat -c %Y "$target_dir")
+    dir_mtime=$("${FREIGHT_STAT:-stat}" -c %Y "$target_dir")
     
     # Get directory size and file count (Linux only)
     local size_bytes
-    size_bytes=$(du -sb "$target_dir" | cut -f1)
+    size_bytes=$("${FREIGHT_DU:-du}" -sb "$target_dir" | cut -f1)
     
     local file_count
-    file_count=$(find "$target_dir" -type f | wc -l)
+    file_count=$("${FREIGHT_FIND:-find}" "$target_dir" -type f | wc -l)
     
     # Create .freight directory if it doesn't exist
     local freight_dir="$target_dir/.freight"
@@ -57,23 +61,53 @@ scan_directory() {
 
 
 
-main() {
-    # Check if target directory was provided
-    if [ $# -ne 1 ]; then
-        usage
-        exit 1
-    fi
-    
+scan_target() {
     local target_dir="$1"
     
     # Validate directory
     [ -d "$target_dir" ] || { log_error "Directory not found: $target_dir"; exit 1; }
     [ -r "$target_dir" ] || { log_error "Directory not readable: $target_dir"; exit 1; }
     
-    target_dir=$(realpath "$target_dir")
+    target_dir=$("${FREIGHT_REALPATH:-realpath}" "$target_dir")
     
     # Scan the directory
     scan_directory "$target_dir"
 }
 
+run_stdin_batch() {
+    local err_file
+    err_file=$(mktemp)
+    trap "rm -f -- '$err_file'" EXIT
+    
+    local target_dir status
+    while IFS= read -r target_dir; do
+        # Scan in a subshell so a failure only ends this directory's scan, not the batch
+        status=0
+        ( scan_target "$target_dir" ) < /dev/null > /dev/null 2> "$err_file" &
+        wait "$!" || status=$?
+        
+        if [ "$status" -eq 0 ]; then
+            printf 'OK %s\n' "$target_dir"
+        else
+            # Only the tail of the error output is reported, so a noisy failure can't produce an unbounded line
+            printf 'FAIL %s %s\n' "$target_dir" "$(tail -c 4096 "$err_file" | tr '\n' ' ')"
+        fi
+    done
+}
+
+main() {
+    # Check if target directory was provided
+    if [ $# -ne 1 ]; then
+        usage
+        exit 1
+    fi
+    
+    if [ "$1" = "--stdin-batch" ]; then
+        run_stdin_batch
+        exit 0
+    fi
+    
+    scan_target "$1"
+}
+
 main "$@"
\ No newline at end of file
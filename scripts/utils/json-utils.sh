@@ -2,7 +2,7 @@
 
 # freight-lib/json-utils.sh - JSON utilities for Freight suite
 
-# Create scan JSON log
+# Create scan JSON log (compact - machine-read only)
 create_scan_json() {
     local size_bytes="$1"
     local file_count="$2"
@@ -11,7 +11,7 @@ create_scan_json() {
     local scan_time
     scan_time=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
     
-    jq -n \
+    "${FREIGHT_JQ:-jq}" -nc \
         --arg scan_time "$scan_time" \
         --argjson size_bytes "$size_bytes" \
         --argjson file_count "$file_count" \
@@ -24,7 +24,7 @@ create_scan_json() {
         }'
 }
 
-# Create clean JSON log
+# Create clean JSON log (compact - machine-read only)
 create_clean_json() {
     local bytes_cleaned="$1"
     local items_cleaned="$2"
@@ -33,7 +33,7 @@ create_clean_json() {
     local clean_time
     clean_time=$(date -u +"%Y-%m-%dT%H:%M:%SZ")
     
-    jq -n \
+    "${FREIGHT_JQ:-jq}" -nc \
         --arg clean_time "$clean_time" \
         --argjson bytes_cleaned "$bytes_cleaned" \
         --argjson items_cleaned "$items_cleaned" \
@@ -49,7 +49,7 @@ create_clean_json() {
 # Get global config file path
 get_global_config() {
     local script_dir
-    script_dir="$(dirname "$(dirname "$(realpath "$0")")")"  # Go up two levels to freight.py dir
+    script_dir="$(dirname "$(dirname "$("${FREIGHT_REALPATH:-realpath}" "$0")")")"  # Go up two levels to freight.py dir
     echo "$script_dir/config.json"
 }
 
@@ -83,10 +83,10 @@ update_global_config() {
     
     if [ -f "$config_file" ]; then
         # Update existing config
-        jq "$jq_cmd" "$config_file" > "$config_file.tmp" && mv "$config_file.tmp" "$config_file"
+        "${FREIGHT_JQ:-jq}" "$jq_cmd" "$config_file" > "$config_file.tmp" && mv "$config_file.tmp" "$config_file"
     else
         # Config should exist by now, but create basic one if needed
-        echo '{}' | jq "$jq_cmd" > "$config_file"
+        echo '{}' | "${FREIGHT_JQ:-jq}" "$jq_cmd" > "$config_file"
     fi
 }
 
@@ -102,7 +102,7 @@ get_migration_root() {
     fi
     
     local migration_root
-    migration_root=$(jq -r '.migration_root // empty' "$config_file" 2>/dev/null)
+    migration_root=$("${FREIGHT_JQ:-jq}" -r '.migration_root // empty' "$config_file" 2>/dev/null)
     
     if [ -z "$migration_root" ]; then
         echo "Error: No migration_root found in global config" >&2
@@ -2,14 +2,38 @@
 Configuration management for Freight NFS Migration Suite
 """
 
+import functools
 import json
 import os
+import stat
 import sys
-from datetime import datetime, timezone
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any
 
-from .utils import Colors, FREIGHT_VERSION
+from .utils import Colors, FREIGHT_VERSION, json_loads, json_dumps, read_file_bytes
+
+# These directories are always ignored by shared directory analysis (infrastructure/system directories)
+_IMPLICIT_IGNORES = frozenset({".freight", ".ssh"})
+
+# Static messages, formatted once at import time
+_MISSING_VERSION_MSG = f"{Colors.RED}Error:{Colors.END} Config file missing version information"
+_UNREADABLE_VERSION_MSG = f"{Colors.YELLOW}⚠️  Could not read config version{Colors.END}\n"
+_ALREADY_INITIALIZED_MSG = f"{Colors.RED}✗{Colors.END} Freight has already been initialized!"
+_INIT_HEADER_MSG = f"\n{Colors.BOLD}{Colors.CYAN}Initializing Freight Migration{Colors.END}"
+_SOURCE_PROMPT = f"\n{Colors.YELLOW}Enter source directory (press Enter for current directory):{Colors.END} "
+_DEST_PROMPT = f"{Colors.YELLOW}Enter destination directory:{Colors.END} "
+_DEST_REQUIRED_MSG = f"{Colors.RED}Destination directory is required.{Colors.END}"
+_CONFIG_CREATED_MSG = f"\n{Colors.BOLD}{Colors.YELLOW}Global configuration created!{Colors.END}"
+_IMPLICIT_IGNORES_NOTE = f"    {Colors.CYAN}Note:{Colors.END} .freight and .ssh directories are always ignored automatically"
+_CONFIG_UPDATED_MSG = f"{Colors.GREEN}✓{Colors.END} Updated root and destination in global config"
+_INIT_DONE_MSG = f"\n{Colors.BOLD}{Colors.CYAN}Freight root initialized successfully!{Colors.END}"
+_NEXT_STEP_SCAN_MSG = f"  2. Run {Colors.YELLOW}freight.py scan{Colors.END} to scan directories"
+
+@functools.lru_cache(maxsize=4)
+def _parse_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse config.json. Cached by (path, mtime, size) so every ConfigManager in the process shares one parse."""
+    return json_loads(read_file_bytes(path))
 
 class ConfigManager:
     """Handles all configuration-related operations"""
@@ -17,24 +41,47 @@ class ConfigManager:
     def __init__(self, script_dir: Path):
         self.script_dir = script_dir
         self.global_config_path = script_dir / 'config.json'
+        # Set once config.json is known to exist, so ensure_global_config can skip its stat
+        self._config_exists: Optional[bool] = None
+        # Parsed config.json, loaded on first use and kept in sync by _write_config
+        self._config: Optional[Dict[str, Any]] = None
     
-    def get_migration_root_from_config(self) -> Optional[str]:
-        """Get migration root from global config file"""
-        if not self.global_config_path.exists():
-            return None
+    def _load_config(self) -> Dict[str, Any]:
+        """Load and parse config.json once per ConfigManager. Raises on missing or unreadable config.
         
+        The returned dict may be shared with other ConfigManagers - copy it before modifying.
+        """
+        if self._config is None:
+            st = os.stat(self.global_config_path)
+            self._config = _parse_config(str(self.global_config_path), st.st_mtime_ns, st.st_size)
+            self._config_exists = True
+        return self._config
+    
+    def _read_config_or_none(self) -> Optional[Dict[str, Any]]:
+        """Get the parsed config, or None if it is missing or unreadable"""
         try:
-            with open(self.global_config_path, 'r') as f:
-                config = json.load(f)
-            return config.get('migration_root')
+            return self._load_config()
         except (json.JSONDecodeError, IOError):
             return None
     
+    def get_migration_root_from_config(self) -> Optional[str]:
+        """Get migration root from global config file"""
+        config = self._read_config_or_none()
+        if config is None:
+            return None
+        return config.get('migration_root')
+    
     def ensure_global_config(self, migration_root: str, dest_path: Optional[str] = None) -> bool:
         """Ensure global config exists and is properly set up. Returns True if config was created."""
+        if self._config_exists:
+            return False
+        
         if self.global_config_path.exists():
+            self._config_exists = True
             return False
         
+        from datetime import datetime, timezone
+        
         config_skeleton = {
             "config_version": FREIGHT_VERSION,
             "migration_root": migration_root,
@@ -44,7 +91,8 @@ class ConfigManager:
             "scan": {
                 "last_scan_time": None,
                 "total_directories": 0,
-                "total_size_bytes": 0
+                "total_size_bytes": 0,
+                "strict_skip_check": False
             },
             "clean": {
                 "last_clean_time": None,
@@ -60,23 +108,47 @@ class ConfigManager:
             }
         }
         
-        with open(self.global_config_path, 'w') as f:
-            json.dump(config_skeleton, f, indent=2)
+        self._write_config(config_skeleton)
+        self._config_exists = True
         
         return True
     
+    def _write_config(self, config: Dict[str, Any]) -> None:
+        """Atomically replace config.json by writing a temp file and renaming it into place"""
+        # A unique temp file, so concurrent writers (e.g. the API and json-utils.sh) never share one
+        fd, tmp_path = tempfile.mkstemp(dir=self.global_config_path.parent, prefix='.config.json.', suffix='.tmp')
+        try:
+            # The file object owns the fd from here on, so it is closed whatever fails below
+            with os.fdopen(fd, 'wb') as f:
+                # mkstemp creates the file 0600; keep the existing config's mode, or the usual default for a new one
+                try:
+                    mode = stat.S_IMODE(os.stat(self.global_config_path).st_mode)
+                except FileNotFoundError:
+                    umask = os.umask(0)
+                    os.umask(umask)
+                    mode = 0o666 & ~umask
+                os.fchmod(f.fileno(), mode)
+                f.write(json_dumps(config))
+                # Make the data durable before the rename is, so a crash can't leave an empty config.json behind
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.global_config_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        self._config = config
+    
     def check_config_version(self) -> None:
         """Check config version compatibility and warn if mismatch"""
-        if not self.global_config_path.exists():
-            return
-        
         try:
-            with open(self.global_config_path, 'r') as f:
-                config = json.load(f)
+            config = self._load_config()
             
             config_version = config.get('config_version') or config.get('freight_version')
             if config_version is None:
-                print(f"{Colors.RED}Error:{Colors.END} Config file missing version information")
+                print(_MISSING_VERSION_MSG)
                 print(f"Please ensure {Colors.CYAN}{self.global_config_path}{Colors.END} contains config_version field")
                 return
             
@@ -85,108 +157,101 @@ class ConfigManager:
                 print(f"   Script version: {Colors.GREEN}{FREIGHT_VERSION}{Colors.END}")
                 print(f"   Config version: {Colors.RED}{config_version}{Colors.END}")
                 print(f"   Please update your config or use a compatible script version.\n")
+        except FileNotFoundError:
+            # No config yet - nothing to check
+            return
         except (json.JSONDecodeError, IOError):
-            print(f"{Colors.YELLOW}⚠️  Could not read config version{Colors.END}\n")
+            print(_UNREADABLE_VERSION_MSG)
     
     def update_config_stats(self, stats: Dict[str, Any]) -> None:
         """Update config.json with calculated statistics"""
-        if not self.global_config_path.exists():
-            return
-        
         try:
-            with open(self.global_config_path, 'r') as f:
-                config = json.load(f)
-            
-            config['scan']['total_directories'] = stats['total_directories']
-            config['scan']['total_size_bytes'] = stats['total_size_bytes']
+            config = dict(self._load_config())
+            config['scan'] = {
+                **config['scan'],
+                'total_directories': stats['total_directories'],
+                'total_size_bytes': stats['total_size_bytes'],
+            }
             
-            with open(self.global_config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            self._write_config(config)
         except (json.JSONDecodeError, IOError):
             pass
     
+    def _get_clean_config(self) -> Optional[Dict[str, Any]]:
+        """Get the clean section of the config. Returns None if config is unreadable, {} if the section is missing."""
+        config = self._read_config_or_none()
+        if config is None:
+            return None
+        clean_config = config.get('clean')
+        return clean_config if clean_config is not None else {}
+    
     def get_shared_directory_threshold(self) -> Optional[int]:
         """Get shared directory threshold from config. Returns None if config is unreadable."""
-        if not self.global_config_path.exists():
-            return None
-        
-        try:
-            with open(self.global_config_path, 'r') as f:
-                config = json.load(f)
-            
-            clean_config = config.get('clean')
-            if clean_config is None:
-                return None
-            
-            threshold = clean_config.get('shared_directory_threshold')
-            return threshold if threshold is not None else None
-        except (json.JSONDecodeError, IOError):
+        clean_config = self._get_clean_config()
+        if clean_config is None:
             return None
+        return clean_config.get('shared_directory_threshold')
+    
+    def get_strict_skip_check(self) -> bool:
+        """Whether scan skip checks should use the directory mtime recorded by the scan instead of scan.json's own mtime"""
+        config = self._read_config_or_none()
+        if config is None:
+            return False
+        return bool(config.get('scan', {}).get('strict_skip_check', False))
     
-    def get_shared_directory_ignore_list(self) -> List[str]:
+    def get_shared_directory_ignore_list(self) -> FrozenSet[str]:
         """Get combined shared directory ignore list: implicit + additional from config."""
-        # These directories are always ignored (infrastructure/system directories)
-        implicit_ignores = [".freight", ".ssh"]
-        
         # Try to get additional ignores from config
         additional_ignores = self._get_additional_shared_ignores()
         if additional_ignores is None:
             # Config unreadable - return just the implicit ignores so we can still function
-            return implicit_ignores
+            return _IMPLICIT_IGNORES
         
         # Combine implicit and additional ignores, removing duplicates
-        combined = list(set(implicit_ignores + additional_ignores))
-        return combined
+        return _IMPLICIT_IGNORES.union(additional_ignores)
     
     def _get_additional_shared_ignores(self) -> Optional[List[str]]:
         """Get user-configured shared directory ignores from config. Returns None if config is unreadable."""
-        if not self.global_config_path.exists():
+        clean_config = self._get_clean_config()
+        if clean_config is None:
             return None
         
-        try:
-            with open(self.global_config_path, 'r') as f:
-                config = json.load(f)
-            
-            clean_config = config.get('clean')
-            if clean_config is None:
-                return []  # Clean section missing, but that's ok - no user ignores
-            
-            user_ignores = clean_config.get('shared_directory_ignore')
-            return user_ignores if user_ignores is not None else []
-        except (json.JSONDecodeError, IOError):
-            return None
+        user_ignores = clean_config.get('shared_directory_ignore')
+        return user_ignores if user_ignores is not None else []
     
     def get_destination_path(self) -> Optional[str]:
         """Get destination path from global config"""
-        if not self.global_config_path.exists():
-            return None
-        
-        try:
-            with open(self.global_config_path, 'r') as f:
-                config = json.load(f)
-            return config.get('dest_path')
-        except (json.JSONDecodeError, IOError):
+        config = self._read_config_or_none()
+        if config is None:
             return None
+        return config.get('dest_path')
+    
+    def get_rsync_flags(self) -> Optional[str]:
+        """Get migrate.rsync_flags from global config. Raises on missing or unreadable config."""
+        return self._load_config().get('migrate', {}).get('rsync_flags')
     
     def init_freight_root(self, root_path: Optional[str] = None) -> None:
         """Initialize a freight root directory with global config"""
+        # Bind colors locally - these are used by many prints below
+        RED, GREEN, YELLOW, CYAN, WHITE, END = Colors.RED, Colors.GREEN, Colors.YELLOW, Colors.CYAN, Colors.WHITE, Colors.END
+        
         # Check if config.json already exists in the same directory as freight.py
         if self.global_config_path.exists():
-            print(f"{Colors.RED}✗{Colors.END} Freight has already been initialized!")
-            print(f"Config file exists: {Colors.CYAN}{self.global_config_path}{Colors.END}")
+            print(_ALREADY_INITIALIZED_MSG)
+            print(f"Config file exists: {CYAN}{self.global_config_path}{END}")
             print(f"\nTo reconfigure your migration:")
-            print(f"  • Edit the existing config: {Colors.YELLOW}nano {self.global_config_path}{Colors.END}")
+            print(f"  • Edit the existing config: {YELLOW}nano {self.global_config_path}{END}")
             print(f"  • Or backup and reinitialize:")
-            print(f"    {Colors.YELLOW}mv {self.global_config_path} {self.global_config_path}.backup{Colors.END}")
-            print(f"    {Colors.YELLOW}freight.py init{Colors.END}")
+            print(f"    {YELLOW}mv {self.global_config_path} {self.global_config_path}.backup{END}")
+            print(f"    {YELLOW}freight.py init{END}")
             sys.exit(1)
         
-        print(f"\n{Colors.BOLD}{Colors.CYAN}Initializing Freight Migration{Colors.END}")
+        print(_INIT_HEADER_MSG)
         
         # Get source directory
         if root_path is None:
             current_dir = os.getcwd()
-            source_input = input(f"\n{Colors.YELLOW}Enter source directory (press Enter for current directory):{Colors.END} ").strip()
+            source_input = input(_SOURCE_PROMPT).strip()
             if source_input == "":
                 root_dir = Path(current_dir).resolve()
             else:
@@ -194,19 +259,21 @@ class ConfigManager:
         else:
             root_dir = Path(root_path).resolve()
         
-        # Verify source directory exists
-        if not root_dir.exists():
-            print(f"{Colors.RED}Error: Source directory does not exist: {root_dir}{Colors.END}")
+        # Verify source directory exists (one stat covers both existence and type)
+        try:
+            root_stat = os.stat(root_dir)
+        except (FileNotFoundError, NotADirectoryError):
+            print(f"{RED}Error: Source directory does not exist: {root_dir}{END}")
             sys.exit(1)
         
-        if not root_dir.is_dir():
-            print(f"{Colors.RED}Error: Source path is not a directory: {root_dir}{Colors.END}")
+        if not stat.S_ISDIR(root_stat.st_mode):
+            print(f"{RED}Error: Source path is not a directory: {root_dir}{END}")
             sys.exit(1)
         
         # Get destination directory
-        dest_input = input(f"{Colors.YELLOW}Enter destination directory:{Colors.END} ").strip()
+        dest_input = input(_DEST_PROMPT).strip()
         if not dest_input:
-            print(f"{Colors.RED}Destination directory is required.{Colors.END}")
+            print(_DEST_REQUIRED_MSG)
             sys.exit(1)
         
         dest_path = Path(dest_input).resolve()
@@ -215,31 +282,30 @@ class ConfigManager:
         config_created = self.ensure_global_config(str(root_dir), str(dest_path))
         
         if config_created:
-            print(f"\n{Colors.GREEN}✓{Colors.END} Created global config: {self.global_config_path}")
-            print(f"\n{Colors.BOLD}{Colors.YELLOW}Global configuration created!{Colors.END}")
-            print(f"Please edit {Colors.CYAN}{self.global_config_path}{Colors.END} to customize your migration settings.")
+            print(f"\n{GREEN}✓{END} Created global config: {self.global_config_path}")
+            print(_CONFIG_CREATED_MSG)
+            print(f"Please edit {CYAN}{self.global_config_path}{END} to customize your migration settings.")
             print(f"Pay special attention to:")
             print(f"  - clean.target_directories (directories to clean from subdirs)")
             print(f"  - clean.shared_directory_threshold (minimum occurrences for shared dirs)")
             print(f"  - clean.shared_directory_ignore (additional dirs to ignore)")
-            print(f"    {Colors.CYAN}Note:{Colors.END} .freight and .ssh directories are always ignored automatically")
+            print(_IMPLICIT_IGNORES_NOTE)
         else:
-            print(f"{Colors.YELLOW}!{Colors.END} Global config already exists: {self.global_config_path}")
+            print(f"{YELLOW}!{END} Global config already exists: {self.global_config_path}")
             # Update the root directory in existing config
             try:
-                with open(self.global_config_path, 'r') as f:
-                    config = json.load(f)
+                config = dict(self._load_config())
                 config['migration_root'] = str(root_dir)
                 config['dest_path'] = str(dest_path)
-                with open(self.global_config_path, 'w') as f:
-                    json.dump(config, f, indent=2)
-                print(f"{Colors.GREEN}✓{Colors.END} Updated root and destination in global config")
+                self._write_config(config)
+                print(_CONFIG_UPDATED_MSG)
             except (json.JSONDecodeError, IOError) as e:
-                print(f"{Colors.RED}✗{Colors.END} Failed to update global config: {e}")
+                self._config_exists = None
+                print(f"{RED}✗{END} Failed to update global config: {e}")
         
-        print(f"\n{Colors.BOLD}{Colors.CYAN}Freight root initialized successfully!{Colors.END}")
-        print(f"Source directory: {Colors.WHITE}{root_dir}{Colors.END}")
-        print(f"Destination directory: {Colors.WHITE}{dest_path}{Colors.END}")
+        print(_INIT_DONE_MSG)
+        print(f"Source directory: {WHITE}{root_dir}{END}")
+        print(f"Destination directory: {WHITE}{dest_path}{END}")
         print(f"\nNext steps:")
-        print(f"  1. Edit {Colors.CYAN}{self.global_config_path}{Colors.END} to customize settings")
-        print(f"  2. Run {Colors.YELLOW}freight.py scan{Colors.END} to scan directories")
\ No newline at end of file
+        print(f"  1. Edit {CYAN}{self.global_config_path}{END} to customize settings")
+        print(_NEXT_STEP_SCAN_MSG)
\ No newline at end of file
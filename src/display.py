@@ -4,8 +4,7 @@ Display and formatting functions for Freight NFS Migration Suite
 
 import os
 import re
-from pathlib import Path
-from typing import List, Dict, Any
+from typing import FrozenSet, List, Dict, Optional, Any
 
 from .utils import Colors, format_size
 from .scan_result import ScanResult
@@ -167,7 +166,8 @@ class DisplayManager:
         
         return lines
     
-    def display_shared_directories(self, directory_counts: Dict[str, int], threshold: int, ignore_list: List[str]) -> None:
+    def display_shared_directories(self, directory_counts: Dict[str, int], threshold: int, ignore_list: FrozenSet[str],
+                                   total_subdirs: Optional[int] = None) -> None:
         """Display shared directories analysis"""
         print(f"\n{Colors.BOLD}{Colors.CYAN}Freight Shared Directory Analysis{Colors.END}")
         print(f"{Colors.CYAN}{'=' * 60}{Colors.END}")
@@ -175,11 +175,10 @@ class DisplayManager:
         
         if ignore_list:
             # Separate implicit vs user-configured ignores for clarity
-            implicit_ignores = ['.freight', '.ssh']
-            user_ignores = [d for d in ignore_list if d not in implicit_ignores]
+            user_ignores = ignore_list.difference(('.freight', '.ssh'))
             
             if user_ignores:
-                print(f"Ignoring: {Colors.YELLOW}{', '.join(ignore_list)}{Colors.END}")
+                print(f"Ignoring: {Colors.YELLOW}{', '.join(sorted(ignore_list))}{Colors.END}")
                 print(f"  {Colors.CYAN}(.freight and .ssh are always ignored){Colors.END}")
             else:
                 print(f"Ignoring: {Colors.YELLOW}.freight, .ssh{Colors.END} {Colors.CYAN}(always ignored){Colors.END}")
@@ -204,8 +203,10 @@ class DisplayManager:
         print(f"\n{'Directory Name':<30} {'Count':<8} {'Percentage'}")
         print('-' * 50)
         
-        # Calculate total subdirs (excluding .freight)
-        total_subdirs = len([d for d in Path(self.migration_root).iterdir() if d.is_dir() and d.name != '.freight'])
+        # Calculate total subdirs (excluding .freight) unless the caller already knows it
+        if total_subdirs is None:
+            with os.scandir(self.migration_root) as it:
+                total_subdirs = sum(1 for entry in it if entry.name != '.freight' and entry.is_dir())
         
         for dir_name, count in sorted_shared:
             percentage = (count / total_subdirs * 100) if total_subdirs > 0 else 0
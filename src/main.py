@@ -4,14 +4,109 @@ Main CLI entry point for Freight NFS Migration Suite
 
 import argparse
 import os
-import subprocess
 import sys
+from typing import TYPE_CHECKING, List, Optional
 
 from .utils import Colors
-from .orchestrator import FreightOrchestrator
 
-def main():
-    """Main entry point"""
+if TYPE_CHECKING:
+    from .orchestrator import FreightOrchestrator
+
+# Path to freight-api.py script, next to the src package
+_API_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'freight-api.py')
+
+# Static messages, formatted once at import time
+_NO_MIGRATION_ROOT_MSG = (
+    f"{Colors.RED}Error:{Colors.END} No migration root found in global config.\n"
+    f"Please run {Colors.YELLOW}freight.py init{Colors.END} first or specify a migration root explicitly."
+)
+_SERVER_HEADER_MSG = f"{Colors.BOLD}{Colors.CYAN}Starting Freight API Server{Colors.END}"
+_SERVER_STOP_HINT_MSG = f"Press {Colors.YELLOW}Ctrl+C{Colors.END} to stop\n"
+_UV_NOT_FOUND_MSG = f"{Colors.RED}Error: UV not found. Please install UV first.{Colors.END}"
+_INTERRUPTED_MSG = f"\n{Colors.YELLOW}Interrupted by user{Colors.END}"
+
+def _build_orchestrator(migration_root: Optional[str]) -> 'FreightOrchestrator':
+    """Construct the orchestrator, exiting with a helpful message when no migration root can be determined"""
+    from .orchestrator import FreightOrchestrator
+    try:
+        return FreightOrchestrator(migration_root)
+    except ValueError as e:
+        if "No migration root specified" in str(e):
+            print(_NO_MIGRATION_ROOT_MSG)
+            sys.exit(1)
+        raise
+
+def _ensure_config_with_notice(orchestrator: 'FreightOrchestrator', purpose: str) -> None:
+    """Ensure global config exists and alert the user if it had to be created"""
+    config_created = orchestrator.ensure_global_config(str(orchestrator.migration_root))
+    if config_created:
+        print(f"{Colors.YELLOW}Global configuration created at {orchestrator.config_manager.global_config_path}{Colors.END}")
+        print(f"Please edit the config file to customize {purpose}.\n")
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {number}")
+    return number
+
+def _add_init_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('directory', nargs='?', default=None,
+                        help='Directory to initialize (default: current directory)')
+
+def _add_scan_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('migration_root', nargs='?', default=None,
+                        help='Migration root directory to scan (default: from global config)')
+    parser.add_argument('script_args', nargs='*',
+                        help='Arguments to pass to freight-scan.sh')
+    parser.add_argument('--jobs', '-j', type=_positive_int, default=None,
+                        help='Number of directories to scan concurrently (default: $FREIGHT_SCAN_PARALLELISM or CPU count, at most 8)')
+
+def _add_overview_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('migration_root', nargs='?', default=None,
+                        help='Migration root directory to analyze (default: from global config)')
+
+def _add_clean_arguments(parser: argparse.ArgumentParser) -> None:
+    # Pass all unknown arguments to script
+    parser.add_argument('migration_root', nargs='?', default=None,
+                        help='Migration root directory to clean (default: from global config)')
+    parser.add_argument('--confirm', action='store_true',
+                        help='Actually perform cleaning (default is dry-run)')
+    parser.add_argument('script_args', nargs='*',
+                        help='Additional arguments to pass to freight-clean.sh')
+
+def _add_migrate_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('migration_root', nargs='?', default=None,
+                        help='Migration root directory to migrate (default: from global config)')
+    parser.add_argument('--confirm', action='store_true',
+                        help='Actually perform migration (default is dry-run)')
+
+def _add_shared_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('migration_root', nargs='?', default=None,
+                        help='Migration root directory to analyze (default: from global config)')
+    parser.add_argument('--threshold', type=int, default=None,
+                        help='Minimum occurrences to show (overrides config setting)')
+
+def _add_serve_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--host', default='0.0.0.0', help='Host to bind to (default: 0.0.0.0)')
+    parser.add_argument('--port', type=int, default=8000, help='Port to bind to (default: 8000)')
+
+# Subcommand name -> (help text, argument builder)
+_COMMANDS = {
+    'init': ('Initialize a freight root directory', _add_init_arguments),
+    'scan': ('Run freight-scan.sh to scan directories', _add_scan_arguments),
+    'overview': ('Show scan overview of migration root', _add_overview_arguments),
+    'clean': ('Clean directories using freight-clean.sh', _add_clean_arguments),
+    'migrate': ('Execute migration of directories', _add_migrate_arguments),
+    'shared': ('Analyze shared directories across subdirectories', _add_shared_arguments),
+    'serve': ('Start FastAPI web server', _add_serve_arguments),
+}
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the full parser with every subcommand (used for --help and unknown commands)"""
     parser = argparse.ArgumentParser(
         description="Freight Orchestrator - Manage and monitor Freight NFS migration suite",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -21,6 +116,7 @@ Examples:
   freight.py init /path/to/root      # Initialize specific directory as freight root
   freight.py scan                    # Run freight-scan.sh using global config
   freight.py scan /nfs1/students     # Run freight-scan.sh on specific migration root
+  freight.py scan --jobs 4           # Run up to 4 directory scans at once
   freight.py overview                # Show scan overview for current directory
   freight.py overview /nfs1/students # Show scan overview for migration root
   freight.py clean                   # Run clean in dry-run mode (default)
@@ -37,54 +133,29 @@ Examples:
     )
     
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
+    for command, (help_text, add_arguments) in _COMMANDS.items():
+        add_arguments(subparsers.add_parser(command, help=help_text))
     
-    # Init command
-    init_parser = subparsers.add_parser('init', help='Initialize a freight root directory')
-    init_parser.add_argument('directory', nargs='?', default=None,
-                           help='Directory to initialize (default: current directory)')
-    
-    # Scan command (runs freight-scan.sh)
-    scan_parser = subparsers.add_parser('scan', help='Run freight-scan.sh to scan directories')
-    scan_parser.add_argument('migration_root', nargs='?', default=None,
-                           help='Migration root directory to scan (default: from global config)')
-    scan_parser.add_argument('script_args', nargs='*',
-                           help='Arguments to pass to freight-scan.sh')
-    
-    # Overview command (shows results)
-    overview_parser = subparsers.add_parser('overview', help='Show scan overview of migration root')
-    overview_parser.add_argument('migration_root', nargs='?', default=None,
-                               help='Migration root directory to analyze (default: from global config)')
-    
-    # Clean command - pass all unknown arguments to script
-    clean_parser = subparsers.add_parser('clean', help='Clean directories using freight-clean.sh')
-    clean_parser.add_argument('migration_root', nargs='?', default=None,
-                            help='Migration root directory to clean (default: from global config)')
-    clean_parser.add_argument('--confirm', action='store_true',
-                            help='Actually perform cleaning (default is dry-run)')
-    clean_parser.add_argument('script_args', nargs='*',
-                            help='Additional arguments to pass to freight-clean.sh')
-    
-    # Migrate command
-    migrate_parser = subparsers.add_parser('migrate', help='Execute migration of directories')
-    migrate_parser.add_argument('migration_root', nargs='?', default=None,
-                               help='Migration root directory to migrate (default: from global config)')
-    migrate_parser.add_argument('--confirm', action='store_true',
-                               help='Actually perform migration (default is dry-run)')
-    
-    # Shared command
-    shared_parser = subparsers.add_parser('shared', help='Analyze shared directories across subdirectories')
-    shared_parser.add_argument('migration_root', nargs='?', default=None,
-                             help='Migration root directory to analyze (default: from global config)')
-    shared_parser.add_argument('--threshold', type=int, default=None,
-                             help='Minimum occurrences to show (overrides config setting)')
-    
-    # Serve command
-    serve_parser = subparsers.add_parser('serve', help='Start FastAPI web server')
-    serve_parser.add_argument('--host', default='0.0.0.0', help='Host to bind to (default: 0.0.0.0)')
-    serve_parser.add_argument('--port', type=int, default=8000, help='Port to bind to (default: 8000)')
-    
+    return parser
+
+def _build_command_parser(command: str) -> argparse.ArgumentParser:
+    """Build a standalone parser for a single subcommand"""
+    _, add_arguments = _COMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f"{os.path.basename(sys.argv[0])} {command}")
+    add_arguments(parser)
+    parser.set_defaults(command=command)
+    return parser
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse CLI arguments, only constructing the parser for the requested subcommand"""
+    if argv and argv[0] in _COMMANDS:
+        return _build_command_parser(argv[0]).parse_args(argv[1:])
+    return _build_parser().parse_args(argv)
+
+def main():
+    """Main entry point"""
     # Parse arguments
-    args = parser.parse_args()
+    args = _parse_args(sys.argv[1:])
     
     if not args.command:
         # Default to overview command when no arguments provided
@@ -94,64 +165,29 @@ Examples:
     try:
         if args.command == 'init':
             # Initialize freight root
+            from .orchestrator import FreightOrchestrator
             orchestrator = FreightOrchestrator(args.directory or os.getcwd())
             orchestrator.init_freight_root(args.directory)
             
         elif args.command == 'scan':
             # Run scan operation
-            try:
-                orchestrator = FreightOrchestrator(args.migration_root)
-            except ValueError as e:
-                if "No migration root specified" in str(e):
-                    print(f"{Colors.RED}Error:{Colors.END} No migration root found in global config.")
-                    print(f"Please run {Colors.YELLOW}freight.py init{Colors.END} first or specify a migration root explicitly.")
-                    sys.exit(1)
-                raise
-            
-            # Ensure global config exists
-            config_created = orchestrator.ensure_global_config(str(orchestrator.migration_root))
-            if config_created:
-                print(f"{Colors.YELLOW}Global configuration created at {orchestrator.config_manager.global_config_path}{Colors.END}")
-                print(f"Please edit the config file to customize scanning settings before running scan operations.\n")
-            
-            orchestrator.run_scan(extra_args=args.script_args)
+            orchestrator = _build_orchestrator(args.migration_root)
+            _ensure_config_with_notice(orchestrator, "scanning settings before running scan operations")
+            
+            orchestrator.run_scan(extra_args=args.script_args, jobs=args.jobs)
             
         elif args.command == 'overview':
             # Show scan overview
-            try:
-                orchestrator = FreightOrchestrator(args.migration_root)
-            except ValueError as e:
-                if "No migration root specified" in str(e):
-                    print(f"{Colors.RED}Error:{Colors.END} No migration root found in global config.")
-                    print(f"Please run {Colors.YELLOW}freight.py init{Colors.END} first or specify a migration root explicitly.")
-                    sys.exit(1)
-                raise
-            
-            # Ensure global config exists and alert if created
-            config_created = orchestrator.ensure_global_config(str(orchestrator.migration_root))
-            if config_created:
-                print(f"{Colors.YELLOW}Global configuration created at {orchestrator.config_manager.global_config_path}{Colors.END}")
-                print(f"Please edit the config file to customize settings before running overview operations.\n")
+            orchestrator = _build_orchestrator(args.migration_root)
+            _ensure_config_with_notice(orchestrator, "settings before running overview operations")
             
             orchestrator.scan_directories()
             orchestrator.display_overview()
             
         elif args.command == 'clean':
             # Run clean operation
-            try:
-                orchestrator = FreightOrchestrator(args.migration_root)
-            except ValueError as e:
-                if "No migration root specified" in str(e):
-                    print(f"{Colors.RED}Error:{Colors.END} No migration root found in global config.")
-                    print(f"Please run {Colors.YELLOW}freight.py init{Colors.END} first or specify a migration root explicitly.")
-                    sys.exit(1)
-                raise
-            
-            # Ensure global config exists
-            config_created = orchestrator.ensure_global_config(str(orchestrator.migration_root))
-            if config_created:
-                print(f"{Colors.YELLOW}Global configuration created at {orchestrator.config_manager.global_config_path}{Colors.END}")
-                print(f"Please edit the config file to customize cleaning settings before running clean operations.\n")
+            orchestrator = _build_orchestrator(args.migration_root)
+            _ensure_config_with_notice(orchestrator, "cleaning settings before running clean operations")
             
             # Build script arguments
             script_args = list(args.script_args) if args.script_args else []
@@ -162,39 +198,15 @@ Examples:
             
         elif args.command == 'migrate':
             # Execute migration
-            try:
-                orchestrator = FreightOrchestrator(args.migration_root)
-            except ValueError as e:
-                if "No migration root specified" in str(e):
-                    print(f"{Colors.RED}Error:{Colors.END} No migration root found in global config.")
-                    print(f"Please run {Colors.YELLOW}freight.py init{Colors.END} first or specify a migration root explicitly.")
-                    sys.exit(1)
-                raise
-            
-            # Ensure global config exists
-            config_created = orchestrator.ensure_global_config(str(orchestrator.migration_root))
-            if config_created:
-                print(f"{Colors.YELLOW}Global configuration created at {orchestrator.config_manager.global_config_path}{Colors.END}")
-                print(f"Please edit the config file to customize migration settings before running migration operations.\n")
+            orchestrator = _build_orchestrator(args.migration_root)
+            _ensure_config_with_notice(orchestrator, "migration settings before running migration operations")
             
             orchestrator.run_migration(args.confirm)
             
         elif args.command == 'shared':
             # Show shared directories analysis
-            try:
-                orchestrator = FreightOrchestrator(args.migration_root)
-            except ValueError as e:
-                if "No migration root specified" in str(e):
-                    print(f"{Colors.RED}Error:{Colors.END} No migration root found in global config.")
-                    print(f"Please run {Colors.YELLOW}freight.py init{Colors.END} first or specify a migration root explicitly.")
-                    sys.exit(1)
-                raise
-            
-            # Ensure global config exists
-            config_created = orchestrator.ensure_global_config(str(orchestrator.migration_root))
-            if config_created:
-                print(f"{Colors.YELLOW}Global configuration created at {orchestrator.config_manager.global_config_path}{Colors.END}")
-                print(f"Please edit the config file to customize shared directory analysis settings.\n")
+            orchestrator = _build_orchestrator(args.migration_root)
+            _ensure_config_with_notice(orchestrator, "shared directory analysis settings")
             
             # Override threshold if provided
             if args.threshold is not None:
@@ -207,29 +219,27 @@ Examples:
         elif args.command == 'serve':
             # Start FastAPI server
             
-            # Path to freight-api.py script
-            api_script = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'freight-api.py')
+            api_script = _API_SCRIPT_PATH
             
             if not os.path.exists(api_script):
                 print(f"{Colors.RED}Error:{Colors.END} freight-api.py not found at {api_script}")
                 sys.exit(1)
             
-            print(f"{Colors.BOLD}{Colors.CYAN}Starting Freight API Server{Colors.END}")
+            print(_SERVER_HEADER_MSG)
             print(f"Server will run on {Colors.WHITE}http://{args.host}:{args.port}{Colors.END}")
-            print(f"Press {Colors.YELLOW}Ctrl+C{Colors.END} to stop\n")
+            print(_SERVER_STOP_HINT_MSG)
             
             try:
-                # Run the API script with UV, passing host/port as environment variables
+                # Replace this process with the API script under UV, passing host/port as environment variables
                 env = os.environ.copy()
                 env['FREIGHT_API_HOST'] = args.host
                 env['FREIGHT_API_PORT'] = str(args.port)
                 
-                subprocess.run(['uv', 'run', api_script], env=env, check=True)
-            except subprocess.CalledProcessError as e:
-                print(f"{Colors.RED}Failed to start API server{Colors.END}")
-                sys.exit(1)
+                # exec does not return, so flush anything still buffered first
+                sys.stdout.flush()
+                os.execvpe('uv', ['uv', 'run', api_script], env)
             except FileNotFoundError:
-                print(f"{Colors.RED}Error: UV not found. Please install UV first.{Colors.END}")
+                print(_UV_NOT_FOUND_MSG)
                 print("Install with: curl -LsSf https://astral.sh/uv/install.sh | sh")
                 sys.exit(1)
             
@@ -237,7 +247,7 @@ Examples:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}Interrupted by user{Colors.END}")
+        print(_INTERRUPTED_MSG)
         sys.exit(1)
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
@@ -2,20 +2,97 @@
 Core orchestrator for Freight NFS Migration Suite
 """
 
+import functools
 import json
-import subprocess
+import operator
+import os
+import shutil
+import stat
 import sys
 import time
 import threading
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterator, List, Optional, Tuple, Any
 
-from .utils import Colors
+from .utils import Colors, format_size, json_dumps, json_loads, read_file_bytes
 from .scan_result import ScanResult
 from .config import ConfigManager
 from .display import DisplayManager
 
+# asyncio (~50ms) and subprocess are imported where they are used, so commands that never
+# launch anything (overview, shared, the API) don't pay for them at startup
+if TYPE_CHECKING:
+    import asyncio
+
+@functools.lru_cache(maxsize=None)
+def _which(command: str) -> Optional[str]:
+    """Locate command on PATH, remembering the answer for the rest of the process"""
+    return shutil.which(command)
+
+# Tools the freight-*.sh scripts call -> variable their resolved path is exported in
+_SCRIPT_TOOLS = {
+    'jq': 'FREIGHT_JQ',
+    'du': 'FREIGHT_DU',
+    'stat': 'FREIGHT_STAT',
+    'find': 'FREIGHT_FIND',
+    'realpath': 'FREIGHT_REALPATH',
+}
+
+@functools.lru_cache(maxsize=None)
+def _script_env() -> Dict[str, str]:
+    """Environment for the freight-*.sh scripts, carrying the tool paths already resolved here
+    so each script run doesn't search PATH for them again. Values already set by the user win."""
+    env = dict(os.environ)
+    for tool, var in _SCRIPT_TOOLS.items():
+        path = _which(tool)
+        if path is not None:
+            env.setdefault(var, path)
+    return env
+
+# Default cap on concurrent scans: each runs du/find against the same (often NFS) server
+_MAX_DEFAULT_SCAN_PARALLELISM = 8
+
+def _scan_parallelism() -> int:
+    """Number of concurrent freight-scan.sh runs (FREIGHT_SCAN_PARALLELISM, default: CPU count, at most 8)"""
+    try:
+        return max(1, int(os.environ['FREIGHT_SCAN_PARALLELISM']))
+    except (KeyError, ValueError):
+        return min(_MAX_DEFAULT_SCAN_PARALLELISM, os.cpu_count() or 4)
+
+# Bytes of a failed scan's error output kept for the failure report
+_MAX_ERROR_BYTES = 4096
+
+# Number of skipped-directory progress lines written to stdout at once
+_PROGRESS_BATCH_SIZE = 16
+
+# Per-directory ScanResult fields, in get_overview_data output order
+_COLUMN_FIELDS = ('name', 'directory', 'has_scan', 'size_bytes', 'file_count', 'has_clean_data', 'bytes_cleaned', 'scan_time')
+_get_column_fields = operator.attrgetter(*_COLUMN_FIELDS)
+_get_size_bytes = operator.attrgetter('size_bytes')
+
+@functools.lru_cache(maxsize=4096)
+def _parse_json_file(path: str, mtime_ns: int, size: int, keys: Optional[Tuple[str, ...]]) -> Any:
+    """Parse a .freight JSON file. mtime_ns/size are part of the cache key, so a changed file is parsed again."""
+    data = json_loads(read_file_bytes(path))
+    if keys is not None:
+        data = {k: data[k] for k in keys if k in data}
+    return data
+
+def _load_json_cached(path: str, keys: Optional[Tuple[str, ...]] = None) -> Any:
+    """Parse a JSON file, reusing the previous parse if the file's mtime and size are unchanged.
+    If keys is given, only those top-level keys of the object are kept."""
+    st = os.stat(path)
+    return _parse_json_file(path, st.st_mtime_ns, st.st_size, keys)
+
+# The only scan.json keys the orchestrator reads
+_SCAN_SUMMARY_KEYS = ('size_bytes', 'file_count', 'directory_mtime', 'scan_time')
+
+# directory_mtime in scan.json, written by freight-scan.sh as a quoted epoch string (bare numbers also accepted)
+_DIRECTORY_MTIME_RE = re.compile(rb'"directory_mtime"\s*:\s*"?(\d+)"?\s*[,}]')
+
 class FreightOrchestrator:
     """Main orchestrator class for managing Freight operations"""
     
@@ -31,80 +108,145 @@ class FreightOrchestrator:
             raise ValueError("No migration root specified and no global config found")
             
         self.migration_root = Path(migration_root).resolve()
+        # The root doesn't change, so stat it once: True/False for directory/not, None if it doesn't exist
+        # (including a path that runs through a regular file, as Path.exists() treats it)
+        try:
+            self._root_is_dir: Optional[bool] = stat.S_ISDIR(os.stat(self.migration_root).st_mode)
+        except (FileNotFoundError, NotADirectoryError):
+            self._root_is_dir = None
         self.scan_results: List[ScanResult] = []
+        # Column view, statistics and display manager for the current scan_results; reset to None whenever scan_results is reloaded
+        self._columns: Optional[Dict[str, Tuple[Any, ...]]] = None
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._display_manager: Optional[DisplayManager] = None
+        # _list_subdirs result and the root mtime it was listed at; reused while the root is unchanged
+        self._subdir_index: Optional[List[os.DirEntry]] = None
+        self._subdir_index_mtime_ns = 0
+        # True once scan_directories has loaded scan_results and nothing this orchestrator ran has rescanned since
+        self._scan_results_fresh = False
         
         # Check version compatibility
         self.config_manager.check_config_version()
     
     def scan_directories(self) -> None:
         """Scan all subdirectories for .freight/scan.json and clean.json files"""
-        if not self.migration_root.exists():
-            raise FileNotFoundError(f"Directory not found: {self.migration_root}")
+        self._require_root_dir("Directory not found")
+        
+        subdirs = self._list_subdirs()
+        
+        # Loading is dominated by open/read latency (especially on NFS), so overlap it across threads.
+        # executor.map keeps results in sorted order.
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(subdirs)))) as executor:
+            self.scan_results = list(executor.map(self._load_one, subdirs))
+        self._columns = None
+        self._stats_cache = None
+        self._display_manager = None
+        self._scan_results_fresh = True
+    
+    def _require_root_dir(self, not_found: str = "Migration root not found") -> None:
+        """Raise FileNotFoundError/NotADirectoryError unless the migration root is an existing directory"""
+        if self._root_is_dir is None:
+            raise FileNotFoundError(f"{not_found}: {self.migration_root}")
         
-        if not self.migration_root.is_dir():
+        if not self._root_is_dir:
             raise NotADirectoryError(f"Path is not a directory: {self.migration_root}")
+    
+    def _list_subdirs(self) -> List[os.DirEntry]:
+        """List immediate subdirectories of the migration root, excluding .freight, sorted by name.
+        The list is shared between calls - don't modify it."""
+        # Adding, removing or renaming a subdirectory changes the root's mtime, so a single stat
+        # tells us whether the previous listing still holds
+        mtime_ns = os.stat(self.migration_root).st_mtime_ns
+        if self._subdir_index is None or mtime_ns != self._subdir_index_mtime_ns:
+            # DirEntry.is_dir() answers from the readdir entry type, so only symlinks need an extra stat
+            with os.scandir(self.migration_root) as it:
+                subdirs = [entry for entry in it if entry.name != '.freight' and entry.is_dir()]
+            subdirs.sort(key=lambda entry: entry.name)
+            self._subdir_index = subdirs
+            self._subdir_index_mtime_ns = mtime_ns
+        return self._subdir_index
+    
+    def _load_one(self, subdir: os.DirEntry) -> ScanResult:
+        """Load .freight/scan.json and clean.json for a single subdirectory"""
+        freight_dir = os.path.join(subdir.path, '.freight')
         
-        # Find all immediate subdirectories, excluding .freight
-        subdirs = [d for d in self.migration_root.iterdir() if d.is_dir() and d.name != '.freight']
+        # One readdir of .freight tells us which files exist, instead of a stat per file
+        try:
+            with os.scandir(freight_dir) as it:
+                present = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            # Never scanned or cleaned - nothing else to look up
+            return ScanResult(subdir.path)
+        
+        scan_file = os.path.join(freight_dir, 'scan.json')
+        clean_file = os.path.join(freight_dir, 'clean.json')
+        
+        # Load scan data
+        scan_data = None
+        has_scan = False
+        if 'scan.json' in present:
+            try:
+                scan_data = _load_json_cached(scan_file, _SCAN_SUMMARY_KEYS)
+                has_scan = True
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Warning: Could not parse {scan_file}: {e}", file=sys.stderr)
+        
+        # Load clean data
+        clean_data = None
+        if 'clean.json' in present:
+            try:
+                clean_data = _load_json_cached(clean_file)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Warning: Could not parse {clean_file}: {e}", file=sys.stderr)
         
-        for subdir in sorted(subdirs):
-            scan_file = subdir / '.freight' / 'scan.json'
-            clean_file = subdir / '.freight' / 'clean.json'
-            
-            # Load scan data
-            scan_data = None
-            has_scan = False
-            if scan_file.exists():
-                try:
-                    with open(scan_file, 'r') as f:
-                        scan_data = json.load(f)
-                    has_scan = True
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"Warning: Could not parse {scan_file}: {e}", file=sys.stderr)
-            
-            # Load clean data
-            clean_data = None
-            if clean_file.exists():
-                try:
-                    with open(clean_file, 'r') as f:
-                        clean_data = json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"Warning: Could not parse {clean_file}: {e}", file=sys.stderr)
-            
-            result = ScanResult(str(subdir), has_scan, scan_data, clean_data)
-            self.scan_results.append(result)
+        return ScanResult(subdir.path, has_scan, scan_data, clean_data)
+    
+    def _get_display_manager(self) -> DisplayManager:
+        """DisplayManager over the current scan_results, shared by every display method"""
+        if self._display_manager is None:
+            self._display_manager = DisplayManager(self.migration_root, self.scan_results)
+        return self._display_manager
+    
+    def _get_columns(self) -> Dict[str, Tuple[Any, ...]]:
+        """Column view of scan_results: one tuple per _COLUMN_FIELDS field, built once per scan"""
+        if self._columns is None:
+            # Pull every field off each result in one attrgetter call, then transpose rows into columns
+            columns = list(zip(*map(_get_column_fields, self.scan_results))) or [()] * len(_COLUMN_FIELDS)
+            self._columns = dict(zip(_COLUMN_FIELDS, columns))
+        return self._columns
     
     def get_statistics(self) -> Dict[str, Any]:
         """Calculate overall statistics"""
-        total_dirs = len(self.scan_results)
-        scanned_dirs = sum(1 for r in self.scan_results if r.has_scan)
-        total_size = sum(r.size_bytes for r in self.scan_results if r.has_scan)
-        total_files = sum(r.file_count for r in self.scan_results if r.has_scan)
-        total_cleanable = sum(r.bytes_cleaned for r in self.scan_results if r.has_clean_data)
-        
-        completion_rate = (scanned_dirs / total_dirs * 100) if total_dirs > 0 else 0
+        if self._stats_cache is None:
+            columns = self._get_columns()
+            total_dirs = len(self.scan_results)
+            
+            # size_bytes/file_count are already 0 for unscanned directories and bytes_cleaned is 0 without
+            # clean data, so each total is a plain sum over its column
+            scanned_dirs = sum(columns['has_scan'])
+            total_size = sum(columns['size_bytes'])
+            total_files = sum(columns['file_count'])
+            total_cleanable = sum(columns['bytes_cleaned'])
+            
+            completion_rate = (scanned_dirs / total_dirs * 100) if total_dirs > 0 else 0
+            
+            self._stats_cache = {
+                'total_directories': total_dirs,
+                'scanned_directories': scanned_dirs,
+                'unscanned_directories': total_dirs - scanned_dirs,
+                'completion_rate': completion_rate,
+                'total_size_bytes': total_size,
+                'total_files': total_files,
+                'total_cleanable_bytes': total_cleanable
+            }
         
-        return {
-            'total_directories': total_dirs,
-            'scanned_directories': scanned_dirs,
-            'unscanned_directories': total_dirs - scanned_dirs,
-            'completion_rate': completion_rate,
-            'total_size_bytes': total_size,
-            'total_files': total_files,
-            'total_cleanable_bytes': total_cleanable
-        }
+        # Hand out a copy so callers can't alter the cached totals
+        return dict(self._stats_cache)
     
     def check_dependencies(self, deps: List[str]) -> None:
         """Check for required system dependencies"""
-        missing_deps = []
-        
-        for dep in deps:
-            try:
-                result = subprocess.run(['which', dep], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
-                if not result.stdout.strip():
-                    missing_deps.append(dep)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                missing_deps.append(dep)
+        # shutil.which walks PATH in-process instead of forking `which` per dependency
+        missing_deps = [dep for dep in deps if _which(dep) is None]
         
         if missing_deps:
             print(f"{Colors.RED}Error: Missing required dependencies:{Colors.END}")
@@ -120,20 +262,8 @@ class FreightOrchestrator:
         # Update config.json with calculated stats
         self.config_manager.update_config_stats(stats)
         
-        # Convert scan results to serializable format
-        directories = []
-        for result in self.scan_results:
-            dir_data = {
-                'name': result.name,
-                'directory': result.directory,
-                'has_scan': result.has_scan,
-                'size_bytes': result.size_bytes,
-                'file_count': result.file_count,
-                'has_clean_data': result.has_clean_data,
-                'bytes_cleaned': result.bytes_cleaned,
-                'scan_time': result.scan_time
-            }
-            directories.append(dir_data)
+        # Convert scan results to serializable format: each row comes straight off its ScanResult in one attrgetter call
+        directories = [dict(zip(_COLUMN_FIELDS, _get_column_fields(result))) for result in self.scan_results]
         
         return {
             'stats': stats,
@@ -141,6 +271,10 @@ class FreightOrchestrator:
             'migration_root': str(self.migration_root)
         }
 
+    def get_overview_json(self) -> bytes:
+        """Get overview data serialized as compact JSON bytes, ready to send or write out"""
+        return json_dumps(self.get_overview_data(), indent=False)
+    
     def display_overview(self) -> None:
         """Display the overview of scan status with grid layout for directories"""
         stats = self.get_statistics()
@@ -149,8 +283,7 @@ class FreightOrchestrator:
         self.config_manager.update_config_stats(stats)
         
         # Use DisplayManager to show overview
-        display_manager = DisplayManager(self.migration_root, self.scan_results)
-        display_manager.display_overview(stats)
+        self._get_display_manager().display_overview(stats)
     
     def init_freight_root(self, root_path: Optional[str] = None) -> None:
         """Initialize a freight root directory with global config"""
@@ -158,6 +291,8 @@ class FreightOrchestrator:
     
     def run_script(self, script_name: str, extra_args: Optional[List[str]] = None) -> None:
         """Run a freight script with passthrough arguments"""
+        import subprocess
+        
         # Check dependencies for the specific script
         if script_name == 'clean':
             self.check_dependencies(['jq', 'du', 'find', 'realpath'])
@@ -181,7 +316,7 @@ class FreightOrchestrator:
         
         try:
             # Run the script
-            result = subprocess.run(cmd, check=True)
+            result = subprocess.run(cmd, check=True, env=_script_env())
             print(f"\n{Colors.GREEN}{script_name.title()} completed successfully!{Colors.END}")
         except subprocess.CalledProcessError as e:
             print(f"\n{Colors.RED}{script_name.title()} failed with exit code {e.returncode}{Colors.END}")
@@ -190,25 +325,23 @@ class FreightOrchestrator:
             print(f"{Colors.RED}Error: freight-{script_name}.sh script not found{Colors.END}")
             raise
     
-    def run_orchestrated_scan(self) -> None:
-        """Run orchestrated scan of all subdirectories with mtime optimization"""
+    def run_orchestrated_scan(self, jobs: Optional[int] = None) -> None:
+        """Run orchestrated scan of all subdirectories with mtime optimization.
+        jobs caps concurrent scans (default: FREIGHT_SCAN_PARALLELISM or the CPU count, at most 8)."""
+        import asyncio
+        
         # Check dependencies needed for scanning
         self.check_dependencies(['jq', 'du', 'stat', 'find', 'realpath'])
         
-        if not self.migration_root.exists():
-            raise FileNotFoundError(f"Migration root not found: {self.migration_root}")
-        
-        if not self.migration_root.is_dir():
-            raise NotADirectoryError(f"Path is not a directory: {self.migration_root}")
+        self._require_root_dir()
         
-        # Find all immediate subdirectories, excluding .freight
-        subdirs = [d for d in self.migration_root.iterdir() if d.is_dir() and d.name != '.freight']
+        # Find all immediate subdirectories, excluding .freight (sorted for consistent ordering)
+        subdirs = self._list_subdirs()
         
         if not subdirs:
             print(f"{Colors.YELLOW}No subdirectories found in migration root: {self.migration_root}{Colors.END}")
             return
         
-        subdirs.sort()  # Consistent ordering
         total_dirs = len(subdirs)
         successful_scans = 0
         skipped_scans = 0
@@ -221,44 +354,46 @@ class FreightOrchestrator:
         print(f"Found {Colors.WHITE}{total_dirs}{Colors.END} subdirectories to scan\n")
         
         # Path to freight-scan.sh script
-        scan_script = self.script_dir / 'scripts' / 'freight-scan.sh'
-        if not scan_script.exists():
+        scan_script = os.path.join(self.script_dir, 'scripts', 'freight-scan.sh')
+        if not os.path.exists(scan_script):
             raise FileNotFoundError(f"freight-scan.sh not found: {scan_script}")
         
-        for i, subdir in enumerate(subdirs, 1):
-            dir_name = subdir.name
-            
+        # Skip checks are cheap, so run them up front and only hand real scans to the workers
+        # Skip lines come out in quick succession, so they are written in batches rather than one write per line
+        progress = 0
+        pending = []
+        skip_lines = []
+        strict_skip_check = self.config_manager.get_strict_skip_check()
+        for subdir in subdirs:
             # Check if we should skip based on mtime optimization
-            should_skip, reason = self._should_skip_scan(subdir)
+            should_skip, reason = self._should_skip_scan(subdir, strict_skip_check)
             
             if should_skip:
-                print(f"[{i:3d}/{total_dirs}] Scanning {dir_name}... {Colors.YELLOW}(skipped - {reason}){Colors.END}")
+                progress += 1
+                skip_lines.append(f"[{progress:3d}/{total_dirs}] Scanning {subdir.name}... {Colors.YELLOW}(skipped - {reason}){Colors.END}\n")
                 skipped_scans += 1
-                continue
-            
-            print(f"[{i:3d}/{total_dirs}] Scanning {dir_name}... ", end="", flush=True)
-            
-            try:
-                # Run freight-scan.sh on this subdirectory, suppressing output
-                result = subprocess.run(
-                    [str(scan_script), str(subdir)], 
-                    stdout=subprocess.PIPE, 
-                    stderr=subprocess.PIPE, 
-                    universal_newlines=True, 
-                    check=True
-                )
-                print(f"{Colors.GREEN}✓{Colors.END}")
-                successful_scans += 1
-                
-            except subprocess.CalledProcessError as e:
-                print(f"{Colors.RED}✗{Colors.END}")
-                failed_scans += 1
-                failed_dirs.append((dir_name, e.stderr.strip() if e.stderr else "Unknown error"))
-                
-            except Exception as e:
-                print(f"{Colors.RED}✗{Colors.END}")
-                failed_scans += 1
-                failed_dirs.append((dir_name, str(e)))
+                if len(skip_lines) >= _PROGRESS_BATCH_SIZE:
+                    sys.stdout.write(''.join(skip_lines))
+                    sys.stdout.flush()
+                    skip_lines.clear()
+            else:
+                pending.append(subdir)
+        
+        if skip_lines:
+            sys.stdout.write(''.join(skip_lines))
+            sys.stdout.flush()
+        
+        if pending:
+            jobs = max(1, jobs) if jobs is not None else _scan_parallelism()
+            successful_scans, failed_dirs = asyncio.run(self._scan_pending(scan_script, pending, jobs, progress, total_dirs))
+            failed_scans = len(failed_dirs)
+        
+        # The skip checks cached each entry's stat, and scanning changes subdirectory mtimes,
+        # so list afresh next time
+        self._subdir_index = None
+        if pending:
+            # scan.json files were rewritten (even a failed scan may have truncated one) under any loaded scan_results
+            self._scan_results_fresh = False
         
         # Summary
         print(f"\n{Colors.BOLD}Scan Summary:{Colors.END}")
@@ -270,36 +405,189 @@ class FreightOrchestrator:
         # Report failed directories
         if failed_dirs:
             print(f"\n{Colors.BOLD}{Colors.RED}Failed Directories:{Colors.END}")
-            for dir_name, error in failed_dirs:
+            for dir_name, error in sorted(failed_dirs):
                 print(f"  • {dir_name}: {error}")
         
         print(f"{Colors.CYAN}{'=' * 60}{Colors.END}")
     
-    def _should_skip_scan(self, subdir: Path) -> Tuple[bool, str]:
-        """Check if a directory should be skipped based on mtime optimization"""
-        scan_file = subdir / '.freight' / 'scan.json'
+    async def _scan_pending(self, scan_script: str, pending: List[os.DirEntry], jobs: int, progress: int,
+                            total_dirs: int) -> Tuple[int, List[Tuple[str, str]]]:
+        """Scan the pending subdirectories concurrently, printing progress as each one finishes.
+        Returns the number of successful scans and a (name, error) pair for each failure."""
+        import asyncio
+        
+        # Scans are independent and I/O-bound, so keep several in flight. Each worker drives one long-lived
+        # `freight-scan.sh --stdin-batch` process, so the shell starts once per worker rather than once per directory.
+        work = iter(pending)
+        results: asyncio.Queue = asyncio.Queue()
+        workers = [asyncio.ensure_future(self._scan_worker(scan_script, work, results))
+                   for _ in range(min(jobs, len(pending)))]
+        
+        successful_scans = 0
+        failed_dirs = []
+        
+        # Results are reported as they finish, from this one coroutine
+        for _ in range(len(pending)):
+            subdir, error = await results.get()
+            progress += 1
+            
+            if error is None:
+                print(f"[{progress:3d}/{total_dirs}] Scanning {subdir.name}... {Colors.GREEN}✓{Colors.END}")
+                successful_scans += 1
+            else:
+                print(f"[{progress:3d}/{total_dirs}] Scanning {subdir.name}... {Colors.RED}✗{Colors.END}")
+                failed_dirs.append((subdir.name, error))
+        
+        await asyncio.gather(*workers)
+        
+        # scan.json files were just rewritten - on coarse-timestamp filesystems a rewrite can keep the old
+        # mtime and size, so don't trust any cached parse from before the scan
+        _parse_json_file.cache_clear()
+        return successful_scans, failed_dirs
+    
+    async def _scan_worker(self, scan_script: str, work: Iterator[os.DirEntry], results: 'asyncio.Queue') -> None:
+        """Scan subdirectories taken from work through one `freight-scan.sh --stdin-batch` process,
+        putting (subdir, error message or None) on results for each"""
+        import asyncio
+        
+        proc = None
+        try:
+            # work is shared with the other workers, so each directory is handed out once
+            for subdir in work:
+                path = os.fsencode(subdir.path)
+                error = None
+                # Taken before the scan starts, so a change made while du/find run still counts as a change
+                pre_scan_mtime_ns = self._pre_scan_mtime(subdir.path)
+                try:
+                    if b'\n' in path:
+                        # Can't be sent over the line-based protocol, so give it its own process
+                        error = await self._run_scan_script(scan_script, subdir.path)
+                    else:
+                        if proc is None:
+                            # close_fds=False lets subprocess launch via posix_spawn rather than fork+exec. Python's own
+                            # fds are non-inheritable (PEP 446), so nothing leaks into the child.
+                            proc = await asyncio.create_subprocess_exec(
+                                scan_script, '--stdin-batch',
+                                stdin=asyncio.subprocess.PIPE,
+                                stdout=asyncio.subprocess.PIPE,
+                                stderr=asyncio.subprocess.DEVNULL,
+                                env=_script_env(),
+                                close_fds=False
+                            )
+                        proc.stdin.write(path + b'\n')
+                        await proc.stdin.drain()
+                        reply = await proc.stdout.readline()
+                        
+                        if reply.startswith(b'FAIL '):
+                            error = reply[len(b'FAIL ') + len(path):].decode(errors='replace').strip() or "Unknown error"
+                        elif not reply.startswith(b'OK '):
+                            # The worker died; a fresh one is started for the next directory
+                            error = "freight-scan.sh exited unexpectedly"
+                            await self._stop_scan_worker(proc)
+                            proc = None
+                            
+                except Exception as e:
+                    error = str(e)
+                    if proc is not None:
+                        await self._stop_scan_worker(proc)
+                        proc = None
+                
+                if error is None:
+                    self._write_scan_mtime(subdir.path, pre_scan_mtime_ns)
+                await results.put((subdir, error))
+        finally:
+            if proc is not None:
+                await self._stop_scan_worker(proc)
+    
+    async def _stop_scan_worker(self, proc: 'asyncio.subprocess.Process') -> None:
+        """Close a --stdin-batch worker's input and wait for it to exit"""
+        proc.stdin.close()
+        await proc.wait()
+    
+    async def _run_scan_script(self, scan_script: str, subdir: str) -> Optional[str]:
+        """Run freight-scan.sh on a single subdirectory. Returns an error message on failure, None on success."""
+        import asyncio
+        
+        # Suppress the script's output; stderr is kept for error reporting.
+        # close_fds=False allows a posix_spawn launch, as for the --stdin-batch workers.
+        proc = await asyncio.create_subprocess_exec(
+            scan_script, subdir,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            env=_script_env(),
+            close_fds=False
+        )
+        
+        # Drain stderr keeping only its tail, so memory stays bounded however much the script writes
+        stderr_tail = b''
+        while True:
+            chunk = await proc.stderr.read(65536)
+            if not chunk:
+                break
+            stderr_tail = (stderr_tail + chunk)[-_MAX_ERROR_BYTES:]
+        await proc.wait()
+        
+        if proc.returncode != 0:
+            return stderr_tail.decode(errors='replace').strip() or "Unknown error"
+        
+        return None
+    
+    def _should_skip_scan(self, subdir: os.DirEntry, strict: bool = False) -> Tuple[bool, str]:
+        """Check if a directory should be skipped based on mtime optimization.
+        By default, compare the directory's mtime with scan.json's own; with strict, compare it with the mtime
+        recorded before the last scan started, so changes made while that scan ran are also caught."""
+        freight_dir = os.path.join(subdir.path, '.freight')
+        scan_file = os.path.join(freight_dir, 'scan.json')
         
-        # If no scan.json exists, don't skip
-        if not scan_file.exists():
+        try:
+            scan_stat = os.stat(scan_file)
+        except (FileNotFoundError, NotADirectoryError):
+            # If no scan.json exists, don't skip
             return False, ""
         
         try:
-            # Get directory mtime
+            # Get directory mtime; the entry from the root listing caches its stat, so this is the only one
             dir_stat = subdir.stat()
-            dir_mtime = int(dir_stat.st_mtime)
+            dir_mtime_ns = dir_stat.st_mtime_ns
             
-            # Get scan file mtime from JSON
-            with open(scan_file, 'r') as f:
-                scan_data = json.load(f)
+            # The scan.mtime sidecar is only written once a scan reports OK. A failed scan can leave scan.json
+            # empty or partial, and newer than the sidecar, so the quick checks only trust a scan.json that isn't.
+            try:
+                sidecar_stat = os.stat(os.path.join(freight_dir, 'scan.mtime'))
+                scan_succeeded = scan_stat.st_size > 0 and sidecar_stat.st_mtime_ns >= scan_stat.st_mtime_ns
+            except FileNotFoundError:
+                scan_succeeded = False
             
-            scan_dir_mtime = scan_data.get('directory_mtime')
-            if scan_dir_mtime is None:
-                return False, "no mtime in scan data"
+            if scan_succeeded:
+                if not strict:
+                    # scan.json is written when the scan finishes, so a directory not modified since then is unchanged.
+                    # Three stats, no file reads.
+                    if dir_mtime_ns <= scan_stat.st_mtime_ns:
+                        return True, "no changes"
+                    return False, "directory modified"
+                
+                # The sidecar holds the directory mtime taken before the scan, in nanoseconds
+                stored_ns = self._read_scan_mtime(subdir.path)
+                if stored_ns is not None:
+                    if dir_mtime_ns <= stored_ns:
+                        return True, "no changes"
+                    return False, "directory modified"
             
-            scan_dir_mtime = int(scan_dir_mtime)
+            # Otherwise (including scans from older versions) check scan.json itself: a broken file fails to
+            # parse and is rescanned. Its directory_mtime is taken before du/find run, but only in whole seconds.
+            # Only one field is needed, so pick it out of the raw bytes and parse the document only if that fails
+            match = _DIRECTORY_MTIME_RE.search(read_file_bytes(scan_file))
+            if match is not None:
+                scan_dir_mtime = match.group(1)
+            else:
+                scan_data = _load_json_cached(scan_file, _SCAN_SUMMARY_KEYS)
+                
+                scan_dir_mtime = scan_data.get('directory_mtime')
+                if scan_dir_mtime is None:
+                    return False, "no mtime in scan data"
             
-            # Skip if directory hasn't been modified since last scan
-            if dir_mtime <= scan_dir_mtime:
+            # Skip if directory hasn't been modified since last scan, compared at the stored precision
+            if dir_mtime_ns // 1_000_000_000 <= int(scan_dir_mtime):
                 return True, "no changes"
             else:
                 return False, "directory modified"
@@ -308,37 +596,62 @@ class FreightOrchestrator:
             # If we can't read the scan file or mtime, don't skip
             return False, f"scan data invalid: {e}"
     
-    def run_scan(self, extra_args: Optional[List[str]] = None) -> None:
+    def _read_scan_mtime(self, subdir: str) -> Optional[int]:
+        """Read the directory mtime (in nanoseconds) recorded in .freight/scan.mtime, or None if unavailable"""
+        try:
+            return int(read_file_bytes(os.path.join(subdir, '.freight', 'scan.mtime')))
+        except (FileNotFoundError, ValueError):
+            return None
+    
+    def _pre_scan_mtime(self, subdir: str) -> Optional[int]:
+        """Directory mtime (in nanoseconds) to record for a scan about to start, or None when only the
+        post-scan mtime will do: a first scan creates .freight, which itself changes the directory's mtime"""
+        try:
+            if not os.path.isdir(os.path.join(subdir, '.freight')):
+                return None
+            return os.stat(subdir).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _write_scan_mtime(self, subdir: str, mtime_ns: Optional[int] = None) -> None:
+        """Record the directory mtime taken before a successful scan (see _pre_scan_mtime) in .freight/scan.mtime
+        for cheap skip checks. Stored as integer nanoseconds, so any change made during or after the scan is noticed."""
+        try:
+            if mtime_ns is None:
+                mtime_ns = os.stat(subdir).st_mtime_ns
+            with open(os.path.join(subdir, '.freight', 'scan.mtime'), 'w') as f:
+                f.write(str(mtime_ns))
+        except OSError:
+            # Not fatal - _should_skip_scan falls back to scan.json
+            pass
+    
+    def run_scan(self, extra_args: Optional[List[str]] = None, jobs: Optional[int] = None) -> None:
         """Run the freight-scan.sh script with orchestrator logic"""
         # Run orchestrated scan instead of calling script directly
-        self.run_orchestrated_scan()
+        self.run_orchestrated_scan(jobs)
 
     def analyze_shared_directories(self) -> Dict[str, int]:
         """Analyze shared directories across all subdirectories"""
-        directory_counts = {}
+        self._require_root_dir()
+        
+        directory_counts: Counter = Counter()
         ignore_list = self.config_manager.get_shared_directory_ignore_list()
         
         # ignore_list always contains at least implicit ignores (.freight, .ssh)
         # No need to check for None anymore
         
-        # Find all immediate subdirectories, excluding .freight
-        subdirs = [d for d in self.migration_root.iterdir() if d.is_dir() and d.name != '.freight']
-        
-        for subdir in subdirs:
+        for subdir in self._list_subdirs():
             try:
-                # Get immediate child directories only (not recursive)
-                child_dirs = [d.name for d in subdir.iterdir() if d.is_dir()]
-                
-                # Count each directory name, excluding ignored directories
-                for dir_name in child_dirs:
-                    if dir_name not in ignore_list:
-                        directory_counts[dir_name] = directory_counts.get(dir_name, 0) + 1
+                # Count immediate child directories only (not recursive), excluding ignored directories
+                with os.scandir(subdir.path) as it:
+                    directory_counts.update(entry.name for entry in it
+                                            if entry.name not in ignore_list and entry.is_dir())
                         
             except (PermissionError, OSError) as e:
-                print(f"Warning: Could not access {subdir}: {e}", file=sys.stderr)
+                print(f"Warning: Could not access {subdir.path}: {e}", file=sys.stderr)
                 continue
         
-        return directory_counts
+        return dict(directory_counts)
     
     def display_shared_directories(self) -> None:
         """Display shared directories analysis"""
@@ -354,8 +667,7 @@ class FreightOrchestrator:
         # ignore_list always contains at least implicit ignores, no need to check for None
         
         # Use DisplayManager to show shared directories
-        display_manager = DisplayManager(self.migration_root, self.scan_results)
-        display_manager.display_shared_directories(directory_counts, threshold, ignore_list)
+        self._get_display_manager().display_shared_directories(directory_counts, threshold, ignore_list, len(self._list_subdirs()))
     
     # Delegate config methods to ConfigManager
     def ensure_global_config(self, migration_root: str) -> bool:
@@ -371,7 +683,7 @@ class FreightOrchestrator:
             sys.exit(1)
         return threshold
     
-    def get_shared_directory_ignore_list(self) -> List[str]:
+    def get_shared_directory_ignore_list(self) -> FrozenSet[str]:
         """Get shared directory ignore list (implicit + additional from config)"""
         return self.config_manager.get_shared_directory_ignore_list()
     
@@ -379,12 +691,11 @@ class FreightOrchestrator:
                                        current_index: int, total_dirs: int, expected_size: int, 
                                        expected_files: int) -> bool:
         """Migrate a single directory with background rsync and progress monitoring"""
+        import subprocess
         
         # Get rsync flags from config (required)
         try:
-            with open(self.config_manager.global_config_path, 'r') as f:
-                config = json.load(f)
-            rsync_flags = config.get('migrate', {}).get('rsync_flags')
+            rsync_flags = self.config_manager.get_rsync_flags()
             if not rsync_flags:
                 raise ValueError("No rsync_flags configured in migrate section")
         except (FileNotFoundError, json.JSONDecodeError, ValueError) as e:
@@ -491,12 +802,7 @@ class FreightOrchestrator:
     
     def _format_size(self, size_bytes: int) -> str:
         """Format bytes as human readable size"""
-        size = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.1f}{unit}"
-            size /= 1024.0
-        return f"{size:.1f}PB"
+        return format_size(size_bytes)
     
     def _format_time(self, seconds: float) -> str:
         """Format seconds as human readable time"""
@@ -514,8 +820,9 @@ class FreightOrchestrator:
         # Check dependencies for migration
         self.check_dependencies(['rsync', 'jq', 'realpath'])
         
-        # Load scan data to plan migration
-        self.scan_directories()
+        # Load scan data to plan migration, unless it is already loaded and current
+        if not self._scan_results_fresh:
+            self.scan_directories()
         
         # Check if we have scan data
         scanned_dirs = [r for r in self.scan_results if r.has_scan]
@@ -531,8 +838,8 @@ class FreightOrchestrator:
             print(f"Please edit {Colors.CYAN}{self.config_manager.global_config_path}{Colors.END} and set the 'dest_path' field.")
             return
         
-        # Sort directories by size (smallest first)
-        sorted_dirs = sorted(scanned_dirs, key=lambda r: r.size_bytes)
+        # Sort directories by size (smallest first); the key is read once per directory, straight from the slot
+        sorted_dirs = sorted(scanned_dirs, key=_get_size_bytes)
         
         # Display migration plan
         self._display_migration_plan(sorted_dirs, dest_path)
@@ -622,9 +929,4 @@ class FreightOrchestrator:
     
     def _format_bytes(self, size_bytes: int) -> str:
         """Format bytes as human readable string"""
-        size = float(size_bytes)
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
\ No newline at end of file
+        return format_size(size_bytes, ' ')
\ No newline at end of file
@@ -3,20 +3,40 @@ ScanResult data model for representing directory scan results
 """
 
 import os
-from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 
 from .utils import Colors, format_size
 
+# Shared stand-in for missing scan/clean data, so unscanned directories don't each allocate empty dicts
+_NO_DATA = MappingProxyType({})
+
 class ScanResult:
     """Represents the scan result for a single directory"""
     
+    __slots__ = ('directory', 'name', 'has_scan', 'scan_data', 'clean_data',
+                 'size_bytes', 'file_count', 'scan_time', 'has_clean_data', 'bytes_cleaned')
+    
     def __init__(self, directory: str, has_scan: bool = False, scan_data: Optional[Dict] = None, clean_data: Optional[Dict] = None):
         self.directory = directory
         self.name = os.path.basename(directory)
         self.has_scan = has_scan
-        self.scan_data = scan_data or {}
-        self.clean_data = clean_data or {}
+        self.scan_data = scan_data or _NO_DATA
+        self.clean_data = clean_data or _NO_DATA
+        
+        # Summary fields are read many times (stats, display, export), so compute them once here
+        # Size in bytes and number of files, 0 if no scan data available
+        size = self.scan_data.get('size_bytes') if has_scan else None
+        self.size_bytes: int = size if size is not None else 0
+        count = self.scan_data.get('file_count') if has_scan else None
+        self.file_count: int = count if count is not None else 0
+        # Scan timestamp
+        self.scan_time: Optional[str] = self.scan_data.get('scan_time')
+        
+        # Whether clean data is available, and bytes that would be cleaned (0 if no clean data available)
+        self.has_clean_data = bool(self.clean_data)
+        cleaned = self.clean_data.get('bytes_cleaned') if self.has_clean_data else None
+        self.bytes_cleaned: int = cleaned if cleaned is not None else 0
     
     @property
     def status_icon(self) -> str:
@@ -25,30 +45,12 @@ class ScanResult:
             return f"{Colors.GREEN}✓{Colors.END}"
         return f"{Colors.RED}✗{Colors.END}"
     
-    @property
-    def size_bytes(self) -> int:
-        """Returns size in bytes, 0 if no scan data available"""
-        if not self.has_scan:
-            return 0
-        size = self.scan_data.get('size_bytes')
-        return size if size is not None else 0
-    
-    @property
-    def file_count(self) -> int:
-        """Returns number of files, 0 if no scan data available"""
-        if not self.has_scan:
-            return 0
-        count = self.scan_data.get('file_count')
-        return count if count is not None else 0
-    
-    @property
-    def scan_time(self) -> Optional[str]:
-        """Returns scan timestamp"""
-        return self.scan_data.get('scan_time')
-    
     @property
     def directory_mtime(self) -> Optional[str]:
         """Returns directory modification time"""
+        # Only the display path needs this, so datetime is imported on first use
+        from datetime import datetime, timezone
+        
         mtime_epoch = self.scan_data.get('directory_mtime')
         if mtime_epoch:
             try:
@@ -57,19 +59,6 @@ class ScanResult:
                 return None
         return None
     
-    @property
-    def bytes_cleaned(self) -> int:
-        """Returns bytes that would be cleaned, 0 if no clean data available"""
-        if not self.has_clean_data:
-            return 0
-        cleaned = self.clean_data.get('bytes_cleaned')
-        return cleaned if cleaned is not None else 0
-    
-    @property
-    def has_clean_data(self) -> bool:
-        """Returns whether clean data is available"""
-        return bool(self.clean_data)
-    
     @property
     def problem_directories(self) -> List[Dict[str, Any]]:
         """Returns list of problem directories with their sizes"""
@@ -2,6 +2,15 @@
 Utility functions and constants for Freight NFS Migration Suite
 """
 
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib parser
+    orjson = None
+
 # Freight version - used for config version comparison
 FREIGHT_VERSION = "1.3"
 
@@ -16,11 +25,42 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
-def format_size(size_bytes: int) -> str:
-    """Format bytes to human readable format"""
-    size = float(size_bytes)
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.1f}{unit}"
-        size /= 1024.0
-    return f"{size:.1f}PB"
\ No newline at end of file
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+def format_size(size_bytes: int, sep: str = '') -> str:
+    """Format bytes to human readable format, with sep between the number and the unit"""
+    if size_bytes < 1024:
+        return f"{float(size_bytes):.1f}{sep}B"
+    # Each unit is 2**10 times the previous one, so the unit index falls straight out of the bit length
+    idx = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * idx)):.1f}{sep}{_SIZE_UNITS[idx]}"
+
+def read_file_bytes(path: Union[str, os.PathLike]) -> bytes:
+    """Read a whole file with a single open/fstat/read instead of buffered file objects"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # os.read may return fewer bytes than requested, e.g. on some network filesystems
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj: Any, indent: bool = True) -> bytes:
+    """Serialize obj as JSON bytes (indented, or compact with indent=False), using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(obj)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')